@@ -1,9 +1,45 @@
 import re
+import string
+import sys
+from functools import lru_cache
+
+# Caracteres que identificam uma fórmula do CPC na entrada interativa
+CARACTERES_CPC = frozenset('∧∨¬→↔()')
+
+# Exemplos da demonstração (tuplas imutáveis, criadas uma única vez)
+EXEMPLOS_NL_PARA_CPC = (
+    "chove",
+    "não chove",
+    "chove e faz frio",
+    "chove ou faz sol",
+    "se chove então a rua fica molhada",
+    "chove se e somente se há nuvens"
+)
+
+EXEMPLOS_CPC_PARA_NL = (
+    "A",
+    "¬A",
+    "(A ∧ B)",
+    "(A ∨ C)",
+    "(A → D)",
+    "(A ↔ E)"
+)
 
 class TradutorCPC:
+    # Sem __dict__ por instância: acesso a atributos vira offset em C e
+    # cada tradutor ocupa menos memória
+    __slots__ = (
+        'variaveis_proposicionais', '_var_para_proposicao', '_contador',
+        '_version', 'conectivos_nl_para_cpc', 'conectivos_cpc_para_nl',
+        '_tokens', '_pos', '_re_variavel', '_re_all_ops', '_ws_table',
+        '_lower_strip_chars', '_eh_separador', '_trie_conectivos'
+    )
+
     def __init__(self):
         self.variaveis_proposicionais = {}
-        self.proxima_variavel = 'A'
+        self._var_para_proposicao = {}  # mapa inverso: variável → proposição
+        self._contador = 0  # índice da próxima variável (A..Z, AA..AZ, ...)
+        self._version = 0  # invalida os caches quando o mapeamento cresce
         
         # Mapeamento de conectivos
         self.conectivos_nl_para_cpc = {
@@ -25,148 +61,331 @@ class TradutorCPC:
             '↔': 'se e somente se'
         }
         
-        # Padrões para reconhecimento de sentenças
-        self.padroes_nl = [
-            (r'não\s+(\w+)', self._processar_negacao),
-            (r'se\s+(.+)\s+então\s+(.+)', self._processar_implicacao),
-            (r'(.+)\s+e\s+(.+)', self._processar_conjuncao),
-            (r'(.+)\s+ou\s+(.+)', self._processar_disjuncao),
-            (r'(.+)\s+se e somente se\s+(.+)', self._processar_bicondicional)
-        ]
+        # Estado do analisador sintático (fluxo de tokens e cursor)
+        self._tokens = []
+        self._pos = 0
+
+        # Expressões auxiliares compiladas uma única vez
+        self._re_variavel = re.compile(r'[A-Z]+')
+        self._re_all_ops = re.compile(r'([^¬→↔∧∨]*)([¬→↔∧∨])([^¬→↔∧∨]*)')
+
+        # Tabela para remover todo espaço em branco em uma passada em C
+        self._ws_table = str.maketrans('', '', ' \t\n\r')
+
+        # Caracteres removidos das pontas na normalização (espaços e
+        # pontuação final) em uma única chamada de str.strip
+        self._lower_strip_chars = ' \t\n\r.!?'
+
+        # Autômato de prefixos dos conectivos, construído uma única vez.
+        # Cada nó é um dict caractere → próximo nó; a chave '' marca um
+        # estado de aceitação com o tipo do token. Inclui o conectivo
+        # multi-palavra, que deixa de exigir lookahead no tokenizador.
+        self._eh_separador = frozenset(' \t\n\r')
+        conectivos = dict(self._PALAVRAS_CHAVE)
+        conectivos['se e somente se'] = 'BICOND'
+        self._trie_conectivos = {}
+        for texto, tipo in conectivos.items():
+            no = self._trie_conectivos
+            for caractere in texto:
+                no = no.setdefault(caractere, {})
+            no[''] = tipo
 
     def obter_variavel(self, proposicao):
         """Obtém uma variável proposicional para uma proposição"""
-        proposicao_limpa = proposicao.strip().lower()
-        
-        if proposicao_limpa not in self.variaveis_proposicionais:
-            self.variaveis_proposicionais[proposicao_limpa] = self.proxima_variavel
-            self.proxima_variavel = chr(ord(self.proxima_variavel) + 1)
-        
-        return self.variaveis_proposicionais[proposicao_limpa]
+        # Chaves internadas: menções repetidas da mesma proposição
+        # compartilham o objeto e o hash do dicionário vira comparação
+        # por identidade
+        proposicao_limpa = sys.intern(proposicao.strip().lower())
+
+        # Caminho rápido: um único lookup para proposições já conhecidas
+        variaveis = self.variaveis_proposicionais
+        variavel = variaveis.get(proposicao_limpa)
+        if variavel is not None:
+            return variavel
+
+        variavel = sys.intern(self._nome_var(self._contador))
+        self._contador += 1
+        variaveis[proposicao_limpa] = variavel
+        self._var_para_proposicao[variavel] = proposicao_limpa
+        self._version += 1
+        return variavel
+
+    @staticmethod
+    def _nome_var(indice):
+        """Nome da variável de índice dado: A..Z, depois AA..AZ, BA..."""
+        nome = ''
+        indice += 1
+        while indice:
+            indice, resto = divmod(indice - 1, 26)
+            nome = string.ascii_uppercase[resto] + nome
+        return nome
 
     def nl_para_cpc(self, sentenca):
         """Traduz sentença em linguagem natural para fórmula do CPC"""
+        return self._nl_para_cpc_cache(sentenca, self._version)
+
+    @lru_cache(maxsize=1024)
+    def _nl_para_cpc_cache(self, sentenca, versao):
+        """Corpo memoizado de nl_para_cpc; 'versao' invalida entradas antigas"""
         try:
-            sentenca = sentenca.lower().strip()
-            
-            # Remove pontuação final
-            sentenca = re.sub(r'[.!?]$', '', sentenca)
-            
-            # Processa padrões complexos primeiro
-            for padrao, processador in self.padroes_nl:
-                match = re.search(padrao, sentenca, re.IGNORECASE)
-                if match:
-                    return processador(match.groups())
-            
-            # Se não encontrou padrão complexo, trata como proposição atômica
-            return self.obter_variavel(sentenca)
-            
+            # Normaliza uma única vez; o parser trabalha só sobre tokens
+            tokens = self._tokenize(self._normalizar(sentenca))
+            return self._parse_sentenca(tokens)
+
         except Exception as e:
             return f"Erro na tradução: {str(e)}"
 
+    def nl_para_cpc_batch(self, sentencas):
+        """Traduz uma sequência de sentenças em linguagem natural
+
+        Liga os passos do pipeline (normalização, tokenização, parse) a
+        locais fora do laço, amortizando o overhead por chamada do
+        caminho público; devolve uma lista na mesma ordem da entrada.
+        """
+        normalizar = self._normalizar
+        tokenize = self._tokenize
+        parse = self._parse_sentenca
+        resultados = []
+
+        for sentenca in sentencas:
+            try:
+                resultados.append(parse(tokenize(normalizar(sentenca))))
+            except Exception as e:
+                resultados.append(f"Erro na tradução: {str(e)}")
+
+        return resultados
+
+    def _normalizar(self, sentenca):
+        """Normaliza a sentença (minúsculas, espaços e pontuação final)"""
+        # Um único strip cobre espaços e pontuação das pontas; o join
+        # colapsa espaços internos para o autômato casar o conectivo
+        # multi-palavra mesmo com espaçamento irregular
+        sentenca = sentenca.lower().strip(self._lower_strip_chars)
+        return ' '.join(sentenca.split())
+
     def cpc_para_nl(self, formula):
         """Traduz fórmula do CPC para linguagem natural"""
+        return self._cpc_para_nl_cache(formula, self._version)
+
+    @lru_cache(maxsize=1024)
+    def _cpc_para_nl_cache(self, formula, versao):
+        """Corpo memoizado de cpc_para_nl; 'versao' invalida entradas antigas"""
         try:
-            formula = formula.replace(' ', '')  # Remove espaços
-            
-            # Processa parênteses primeiro
-            while '(' in formula:
-                formula = self._processar_parenteses(formula)
-            
-            # Processa operadores por ordem de precedência
-            formula = self._processar_operadores(formula, ['↔'])
-            formula = self._processar_operadores(formula, ['→'])
-            formula = self._processar_operadores(formula, ['∨'])
-            formula = self._processar_operadores(formula, ['∧'])
-            formula = self._processar_operadores(formula, ['¬'])
+            formula = formula.translate(self._ws_table)  # Remove espaços em branco
             
+            # Processa parênteses primeiro (uma única varredura cobre
+            # grupos aninhados e sequenciais)
+            formula = self._processar_parenteses(formula)
+
+
+            # Processa todos os operadores em uma única passada
+            formula = self._processar_operadores(formula)
+
             return self._traduzir_variaveis(formula)
             
         except Exception as e:
             return f"Erro na tradução: {str(e)}"
 
-    def _processar_negacao(self, grupos):
-        proposicao = grupos[0]
-        var = self.obter_variavel(proposicao)
-        return f"¬{var}"
+    # Palavras-chave reconhecidas pelo tokenizador (conectivos em minúsculas)
+    _PALAVRAS_CHAVE = {
+        'se': 'SE',
+        'então': 'ENTAO',
+        'e': 'E',
+        'ou': 'OU',
+        'não': 'NAO',
+        'implica': 'IMPLICA',
+        'equivale': 'EQUIVALE'
+    }
 
-    def _processar_implicacao(self, grupos):
-        antecedente = grupos[0]
-        consequente = grupos[1]
-        return f"({self.nl_para_cpc(antecedente)} → {self.nl_para_cpc(consequente)})"
+    def _tokenize(self, sentenca):
+        """Converte a sentença em tokens com o autômato de prefixos"""
+        tokens = []
+        atomo = []
+        i = 0
+        n = len(sentenca)
+        eh_separador = self._eh_separador
 
-    def _processar_conjuncao(self, grupos):
-        esquerda = grupos[0]
-        direita = grupos[1]
-        return f"({self.nl_para_cpc(esquerda)} ∧ {self.nl_para_cpc(direita)})"
+        while i < n:
+            if sentenca[i] in eh_separador:
+                i += 1
+                continue
 
-    def _processar_disjuncao(self, grupos):
-        esquerda = grupos[0]
-        direita = grupos[1]
-        return f"({self.nl_para_cpc(esquerda)} ∨ {self.nl_para_cpc(direita)})"
+            tipo, fim = self._casar_conectivo(sentenca, i)
+            if tipo is not None:
+                if atomo:
+                    tokens.append(('ATOMO', ' '.join(atomo)))
+                    atomo = []
+                tokens.append((tipo, None))
+                i = fim
+            else:
+                j = i
+                while j < n and sentenca[j] not in eh_separador:
+                    j += 1
+                atomo.append(sentenca[i:j])
+                i = j
 
-    def _processar_bicondicional(self, grupos):
-        esquerda = grupos[0]
-        direita = grupos[1]
-        return f"({self.nl_para_cpc(esquerda)} ↔ {self.nl_para_cpc(direita)})"
+        if atomo:
+            tokens.append(('ATOMO', ' '.join(atomo)))
+
+        return tokens
+
+    def _casar_conectivo(self, sentenca, inicio):
+        """Casa o conectivo mais longo a partir de 'inicio', se houver
+
+        Percorre o autômato caractere a caractere; só aceita quando o
+        estado é de aceitação e o casamento termina em fronteira de
+        palavra (fim da sentença ou separador).
+        """
+        no = self._trie_conectivos
+        n = len(sentenca)
+        melhor_tipo, melhor_fim = None, inicio
+        j = inicio
+
+        while j < n:
+            no = no.get(sentenca[j])
+            if no is None:
+                break
+            j += 1
+            if '' in no and (j == n or sentenca[j] in self._eh_separador):
+                melhor_tipo, melhor_fim = no[''], j
+
+        return melhor_tipo, melhor_fim
+
+    def _parse_sentenca(self, tokens):
+        """Analisa a lista de tokens e devolve a fórmula correspondente"""
+        self._tokens = tokens
+        self._pos = 0
+        formula = self._parse_bicondicional()
+
+        if self._pos != len(self._tokens):
+            raise ValueError(f"token inesperado: '{self._tokens[self._pos][0]}'")
 
-    def _processar_parenteses(self, formula):
-        """Processa expressões entre parênteses"""
-        padrao = r'\(([^()]+)\)'
-        match = re.search(padrao, formula)
-        
-        if match:
-            expressao_interna = match.group(1)
-            traducao_interna = self._processar_operadores(expressao_interna, ['↔', '→', '∨', '∧', '¬'])
-            traducao_interna = self._traduzir_variaveis(traducao_interna)
-            formula = formula.replace(match.group(0), traducao_interna)
-        
         return formula
 
-    def _processar_operadores(self, formula, operadores):
-        """Processa operadores específicos na fórmula"""
-        for operador in operadores:
-            padrao = rf'([^¬→↔∧∨]+){re.escape(operador)}([^¬→↔∧∨]+)'
-            
-            while True:
-                match = re.search(padrao, formula)
-                if not match:
-                    break
-                
-                esquerda = match.group(1).strip()
-                direita = match.group(2).strip()
-                
-                if operador == '¬':
-                    traducao = f"não {self._obter_proposicao(direita)}"
-                else:
-                    traducao_esq = self._obter_proposicao(esquerda)
-                    traducao_dir = self._obter_proposicao(direita)
-                    conectivo_nl = self.conectivos_cpc_para_nl[operador]
-                    traducao = f"{traducao_esq} {conectivo_nl} {traducao_dir}"
-                
-                formula = formula.replace(match.group(0), traducao)
-        
+    def _peek(self):
+        """Tipo do próximo token, ou None no fim da sentença"""
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos][0]
+        return None
+
+    def _parse_bicondicional(self):
+        esquerda = self._parse_implicacao()
+        while self._peek() in ('BICOND', 'EQUIVALE'):
+            self._pos += 1
+            direita = self._parse_implicacao()
+            esquerda = f"({esquerda} ↔ {direita})"
+        return esquerda
+
+    def _parse_implicacao(self):
+        if self._peek() == 'SE':
+            self._pos += 1
+            antecedente = self._parse_bicondicional()
+            if self._peek() != 'ENTAO':
+                raise ValueError("esperado 'então' após 'se'")
+            self._pos += 1
+            consequente = self._parse_implicacao()
+            return f"({antecedente} → {consequente})"
+
+        # Cadeias de 'implica' associam à direita: acumula as partes numa
+        # lista explícita e dobra ao contrário, sem recursão por elo
+        partes = [self._parse_ou()]
+        while self._peek() == 'IMPLICA':
+            self._pos += 1
+            if self._peek() == 'SE':
+                partes.append(self._parse_implicacao())
+                break
+            partes.append(self._parse_ou())
+
+        formula = partes[-1]
+        for parte in reversed(partes[:-1]):
+            formula = f"({parte} → {formula})"
         return formula
 
+    def _parse_ou(self):
+        esquerda = self._parse_e()
+        while self._peek() == 'OU':
+            self._pos += 1
+            esquerda = f"({esquerda} ∨ {self._parse_e()})"
+        return esquerda
+
+    def _parse_e(self):
+        esquerda = self._parse_nao()
+        while self._peek() == 'E':
+            self._pos += 1
+            esquerda = f"({esquerda} ∧ {self._parse_nao()})"
+        return esquerda
+
+    def _parse_nao(self):
+        negacoes = 0
+        while self._peek() == 'NAO':
+            self._pos += 1
+            negacoes += 1
+        return '¬' * negacoes + self._parse_atomo()
+
+    def _parse_atomo(self):
+        if self._peek() != 'ATOMO':
+            raise ValueError("esperada uma proposição atômica")
+        proposicao = self._tokens[self._pos][1]
+        self._pos += 1
+        return self.obter_variavel(proposicao)
+
+    def _processar_parenteses(self, formula):
+        """Processa expressões entre parênteses em uma única varredura"""
+        # Pilha de acumuladores: cada '(' abre um novo nível; ao fechar,
+        # o conteúdo é traduzido e emendado no nível de fora
+        pilha = [[]]
+
+        for caractere in formula:
+            if caractere == '(':
+                pilha.append([])
+            elif caractere == ')':
+                if len(pilha) == 1:
+                    raise ValueError("parênteses desbalanceados")
+                expressao_interna = ''.join(pilha.pop())
+                traducao_interna = self._processar_operadores(expressao_interna)
+                pilha[-1].append(self._traduzir_variaveis(traducao_interna))
+            else:
+                pilha[-1].append(caractere)
+
+        if len(pilha) > 1:
+            raise ValueError("parênteses desbalanceados")
+
+        return ''.join(pilha[0])
+
+    def _processar_operadores(self, formula):
+        """Processa todos os operadores da fórmula em uma única passada"""
+        traduzida = self._re_all_ops.sub(self._substituir_operador, formula)
+        # Normaliza os espaços deixados por operandos vazios (ex.: prefixo ¬)
+        return ' '.join(traduzida.split())
+
+    def _substituir_operador(self, match):
+        """Monta o trecho em NL correspondente a um operador e seus vizinhos"""
+        esquerda, operador, direita = match.groups()
+        conectivo = self.conectivos_cpc_para_nl[operador]
+        esquerda = self._obter_proposicao(esquerda) if esquerda else ''
+        direita = self._obter_proposicao(direita) if direita else ''
+        return f"{esquerda} {conectivo} {direita}"
+
     def _traduzir_variaveis(self, formula):
         """Traduz variáveis proposicionais de volta para linguagem natural"""
-        for proposicao, var in self.variaveis_proposicionais.items():
-            formula = formula.replace(var, proposicao)
-        return formula
+        # Uma única passada em vez de um str.replace por variável
+        return self._re_variavel.sub(
+            lambda m: self._var_para_proposicao.get(m.group(0), m.group(0)),
+            formula
+        )
 
     def _obter_proposicao(self, variavel):
         """Obtém a proposição original a partir da variável"""
-        for proposicao, var in self.variaveis_proposicionais.items():
-            if var == variavel.strip():
-                return proposicao
-        return variavel.strip()
+        variavel = variavel.strip()
+        return self._var_para_proposicao.get(variavel, variavel)
 
     def mostrar_mapeamento(self):
         """Mostra o mapeamento entre proposições e variáveis"""
-        print("\n=== Mapeamento de Variáveis Proposicionais ===")
-        for proposicao, var in self.variaveis_proposicionais.items():
-            print(f"'{proposicao}' → {var}")
-        print("=============================================\n")
+        linhas = ["\n=== Mapeamento de Variáveis Proposicionais ==="]
+        linhas.extend(f"'{proposicao}' → {var}"
+                      for proposicao, var in self.variaveis_proposicionais.items())
+        linhas.append("=============================================\n")
+        sys.stdout.write('\n'.join(linhas) + '\n')
 
 # Exemplo de uso e demonstração
 def demonstrar_agente():
@@ -174,24 +393,15 @@ def demonstrar_agente():
     
     print("=== AGENTE DE TRADUÇÃO NL ↔ CPC ===\n")
     
-    # Exemplos de tradução NL → CPC
-    exemplos_nl_para_cpc = [
-        "chove",
-        "não chove",
-        "chove e faz frio",
-        "chove ou faz sol",
-        "se chove então a rua fica molhada",
-        "chove se e somente se há nuvens"
-    ]
-    
     print("1. TRADUÇÃO: Linguagem Natural → Cálculo Proposicional")
     print("-" * 50)
     
-    for exemplo in exemplos_nl_para_cpc:
-        traducao = agente.nl_para_cpc(exemplo)
-        print(f"NL: '{exemplo}'")
-        print(f"CPC: {traducao}\n")
-    
+    # Monta o bloco inteiro e escreve de uma vez (1 syscall em vez de 2N)
+    linhas = [f"NL: '{exemplo}'\nCPC: {agente.nl_para_cpc(exemplo)}\n"
+              for exemplo in EXEMPLOS_NL_PARA_CPC]
+    sys.stdout.write('\n'.join(linhas) + '\n')
+
+
     agente.mostrar_mapeamento()
     
     # Exemplos de tradução CPC → NL
@@ -199,19 +409,9 @@ def demonstrar_agente():
     print("-" * 50)
     
     # Usando as mesmas variáveis do mapeamento anterior
-    exemplos_cpc_para_nl = [
-        "A",
-        "¬A",
-        "(A ∧ B)",
-        "(A ∨ C)",
-        "(A → D)",
-        "(A ↔ E)"
-    ]
-    
-    for exemplo in exemplos_cpc_para_nl:
-        traducao = agente.cpc_para_nl(exemplo)
-        print(f"CPC: {exemplo}")
-        print(f"NL: '{traducao}'\n")
+    linhas = [f"CPC: {exemplo}\nNL: '{agente.cpc_para_nl(exemplo)}'\n"
+              for exemplo in EXEMPLOS_CPC_PARA_NL]
+    sys.stdout.write('\n'.join(linhas) + '\n')
 
     # Demonstração interativa
     print("3. MODO INTERATIVO")
@@ -224,7 +424,7 @@ def demonstrar_agente():
         if entrada.lower() == 'sair':
             break
         
-        if any(op in entrada for op in ['∧', '∨', '¬', '→', '↔', '(', ')']):
+        if not CARACTERES_CPC.isdisjoint(entrada):
             # É uma fórmula do CPC
             traducao = agente.cpc_para_nl(entrada)
             print(f"Tradução para NL: {traducao}")